@@ -10,38 +10,298 @@ This system optimally assigns support tickets to agents based on:
 - Availability status
 """
 
+import argparse
+import functools
+import hashlib
+import importlib.util
 import json
 import re
 import math
-from collections import defaultdict
-from typing import Dict, List, Tuple, Any
+import zipfile
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
+
+import numpy as np
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:  # scipy is optional; assignment falls back to the greedy pass
+    linear_sum_assignment = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON is read with the standard library
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; text scanning falls back to a pure-Python trie
+    ahocorasick = None
+
+# Agents at or above this load are considered overloaded
+MAX_REASONABLE_LOAD = 8
+
+# Experience level at which the experience score saturates
+MAX_EXPERIENCE = 15
+
+# Composite score weights and skill threshold
+SKILL_WEIGHT = 0.6
+WORKLOAD_WEIGHT = 0.3
+EXPERIENCE_WEIGHT = 0.1
+SKILL_THRESHOLD = 5.0
+SKILL_PENALTY = 0.3
+
+# Score used for agent slots that must never be matched
+FORBIDDEN_SCORE = -1e12
+
+# Domain bits shared by ticket and skill classification
+DOMAIN_LINUX = 1 << 0
+DOMAIN_WINDOWS = 1 << 1
+DOMAIN_MAC = 1 << 2
+DOMAIN_SECURITY = 1 << 3
+DOMAIN_HARDWARE = 1 << 4
+DOMAIN_NETWORK = 1 << 5
+DOMAIN_DATABASE = 1 << 6
+DOMAIN_CLOUD = 1 << 7
+
+# Whole-word terms that mark a ticket as belonging to a domain
+TICKET_DOMAIN_TERMS = (
+    (DOMAIN_LINUX, ['linux', 'unix', 'chmod', 'directory permissions']),
+    (DOMAIN_WINDOWS, ['windows', 'active directory', 'outlook', 'microsoft']),
+    (DOMAIN_MAC, ['mac', 'macos', 'macbook', 'samba']),
+    (DOMAIN_SECURITY, ['security', 'phishing', 'attack', 'breach', 'locked', 'suspicious']),
+    (DOMAIN_HARDWARE, ['laptop', 'hardware', 'boot', 'printer', 'diagnostic']),
+    (DOMAIN_NETWORK, ['network', 'vpn', 'connection', 'firewall', 'dns']),
+    (DOMAIN_DATABASE, ['database', 'sql', 'query', 'performance', 'slow']),
+    (DOMAIN_CLOUD, ['azure', 'aws', 'cloud', 'website', 'app service']),
+)
+
+# Skill name fragments that place a skill in a domain
+SKILL_DOMAIN_TERMS = (
+    (DOMAIN_LINUX, ['Linux']),
+    (DOMAIN_WINDOWS, ['Windows', 'Active_Directory', 'Microsoft']),
+    (DOMAIN_MAC, ['Mac']),
+    (DOMAIN_SECURITY, ['Security', 'Phishing', 'Antivirus', 'Firewall']),
+    (DOMAIN_HARDWARE, ['Hardware', 'Laptop', 'Printer']),
+    (DOMAIN_NETWORK, ['Network', 'VPN', 'DNS', 'Routing']),
+    (DOMAIN_DATABASE, ['Database']),
+    (DOMAIN_CLOUD, ['Cloud', 'Azure', 'AWS', 'DevOps']),
+)
+
+# Boost applied when a skill's domain matches the ticket's, checked in order
+DOMAIN_BOOSTS = (
+    (DOMAIN_MAC, 2.0),
+    (DOMAIN_SECURITY, 1.8),
+    (DOMAIN_HARDWARE, 1.8),
+    (DOMAIN_NETWORK, 1.8),
+    (DOMAIN_DATABASE, 2.0),
+    (DOMAIN_CLOUD, 1.8),
+)
+
+# Substrings that raise a ticket's priority, with the amount they add
+HIGH_PRIORITY_KEYWORDS = [
+    'critical', 'urgent', 'emergency', 'down', 'outage', 'breach', 'security',
+    'production', 'business-critical', 'attack', 'locked', 'unreachable',
+    'slow performance', 'phishing'
+]
+MEDIUM_PRIORITY_KEYWORDS = [
+    'unable', 'error', 'problem', 'issue', 'failed', 'not working',
+    'access denied', 'boot', 'laptop'
+]
+PRIORITY_KEYWORDS = (
+    [(keyword, 2.0) for keyword in HIGH_PRIORITY_KEYWORDS] +
+    [(keyword, 1.0) for keyword in MEDIUM_PRIORITY_KEYWORDS]
+)
+BASE_PRIORITY = 1.0
+MAX_PRIORITY = 5.0
+
+# Semantic skill matching: model, minimum ticket count and the skill embedding cache.
+# Embedding scoring is a matching-quality option rather than a speedup; runs
+# below the minimum keep keyword matching, as loading the model would dominate them
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_MIN_TICKETS = 500
+# Fixed calibration onto the keyword scale: a cosine similarity of
+# EMBEDDING_REFERENCE_SIMILARITY, typical of clearly related sentence pairs
+# under MiniLM-style models, scores like one skill keyword found both as a
+# phrase and as a token (3 + 2 raw points). Being fixed, a ticket's score
+# never depends on the other tickets in the run
+EMBEDDING_REFERENCE_SIMILARITY = 0.5
+KEYWORD_HIT_SCORE = 3 + 2
+EMBEDDING_SCALE = KEYWORD_HIT_SCORE / EMBEDDING_REFERENCE_SIMILARITY
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_CACHE_FILE = ".skill_embeddings.npz"
+
+# Payload categories in the multi-pattern text automaton
+MATCH_KEYWORD = 0
+MATCH_DOMAIN = 1
+MATCH_PRIORITY = 2
+
+# Per-skill precomputed data: (skill, level, keywords, name words, domain mask)
+SkillProfile = Tuple[str, int, Tuple[str, ...], Tuple[str, ...], int]
+
+def skill_domain_mask(skill: str) -> int:
+    """Classify a skill name into domain bits."""
+    mask = 0
+    for domain, terms in SKILL_DOMAIN_TERMS:
+        if any(term in skill for term in terms):
+            mask |= domain
+    return mask
+
+# Common words ignored during keyword extraction
+_STOP_WORDS: FrozenSet[str] = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'we', 'they', 'it', 'he', 'she', 'you', 'i', 'our', 'their', 'his',
+    'her', 'your', 'my'
+})
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WORD_CHAR_RE = re.compile(r'\w')
+
+def workload_scores(total_load: np.ndarray, available: np.ndarray) -> np.ndarray:
+    """Vectorized TicketAssignmentSystem.calculate_workload_score over total loads."""
+    load_score = np.where(total_load >= MAX_REASONABLE_LOAD, 0.1, np.exp(-(total_load / 3.0)))
+    return load_score * np.where(available, 1.0, 0.2)
+
+def _at_word_boundary(text: str, index: int) -> bool:
+    """Whether a regex \\b boundary sits between text[index - 1] and text[index]."""
+    before = index > 0 and _WORD_CHAR_RE.match(text[index - 1]) is not None
+    after = index < len(text) and _WORD_CHAR_RE.match(text[index]) is not None
+    return before != after
+
+def get_domain_multiplier(skill_mask: int, ticket_mask: int) -> float:
+    """Domain boost/penalty for a skill on a ticket, given both domain masks."""
+    # Linux and Windows skills are boosted on their own platform and penalized on the other
+    if skill_mask & DOMAIN_LINUX:
+        if ticket_mask & DOMAIN_LINUX:
+            return 2.0
+        if ticket_mask & DOMAIN_WINDOWS:
+            return 0.3
+    if skill_mask & DOMAIN_WINDOWS:
+        if ticket_mask & DOMAIN_WINDOWS:
+            return 2.0
+        if ticket_mask & DOMAIN_LINUX:
+            return 0.3
+    
+    for domain, boost in DOMAIN_BOOSTS:
+        if skill_mask & domain and ticket_mask & domain:
+            return boost
+    return 1.0
+
+# Domain multiplier for every (skill mask, ticket mask) pair
+DOMAIN_MASK_COUNT = 1 << 8
+DOMAIN_MULTIPLIER_TABLE = np.array([
+    [get_domain_multiplier(skill_mask, ticket_mask) for ticket_mask in range(DOMAIN_MASK_COUNT)]
+    for skill_mask in range(DOMAIN_MASK_COUNT)
+])
+
+@dataclass
+class TicketFeatures:
+    """Agent-independent features of a ticket, computed once per assignment run."""
+    text: str
+    keyword_set: FrozenSet[str]
+    domain_mask: int
+    priority: float
+    keyword_scores: Optional[np.ndarray]  # None when embeddings score skills
+    name_hits: Optional[np.ndarray]
+
+class KeywordTrie:
+    """Character trie with the add_word/iter interface of ahocorasick.Automaton.
+    
+    iter() walks the trie from every start position, so each pattern shares
+    the work of its prefixes and a text is read once per start position.
+    """
+    
+    def __init__(self):
+        self._root: Dict[Any, Any] = {}
+    
+    def add_word(self, pattern: str, payload: Any):
+        """Add a pattern; its payload is reported for every occurrence."""
+        node = self._root
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[None] = payload
+    
+    def iter(self, text: str):
+        """Yield ``(end_index, payload)`` for every pattern occurrence in text."""
+        for start in range(len(text)):
+            node = self._root
+            for end in range(start, len(text)):
+                node = node.get(text[end])
+                if node is None:
+                    break
+                if None in node:
+                    yield end, node[None]
+
+@functools.lru_cache(maxsize=None)
+def _sentence_transformers_installed() -> bool:
+    """Whether sentence-transformers is importable, checked without importing it (and torch)."""
+    return importlib.util.find_spec('sentence_transformers') is not None
+
+def _content_hash(text: str) -> str:
+    """Stable key for caching embeddings of a piece of text."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
 
 class TicketAssignmentSystem:
-    def __init__(self, dataset_file: str = "dataset.json"):
-        """Initialize the assignment system with dataset."""
+    def __init__(self, dataset_file: str = "dataset.json", use_embeddings: bool = False):
+        """Initialize the assignment system with dataset.
+        
+        With ``use_embeddings`` set (and sentence-transformers installed), runs
+        of at least EMBEDDING_MIN_TICKETS tickets score skills by embedding
+        similarity instead of keyword matching. When that opt-in cannot be
+        honoured, a warning is printed and keyword matching is used.
+        """
         self.dataset_file = dataset_file
+        self.use_embeddings = use_embeddings
         self.agents = []
         self.tickets = []
         self.assignments = []
+        # Tickets of the current assignment run and their features, in the same order
+        self._ticket_run: List[Dict[str, Any]] = []
+        self._ticket_pre: List[Optional[TicketFeatures]] = []
+        self._ticket_index: Dict[int, int] = {}
+        self._embedding_model = None
+        self._skill_embeddings = None
+        self._embedding_active = False
+        self._ticket_embeddings: Dict[str, np.ndarray] = {}
+        
+        # Skill keyword mappings for better matching
+        self.skill_keywords = self._build_skill_keywords()
         
         # Load data
         self.load_data()
         
-        # Skill keyword mappings for better matching
-        self.skill_keywords = self._build_skill_keywords()
+        # Ticket-independent skill data for each agent, in self.agents order
+        self._agent_pre = [self._precompute_agent(agent) for agent in self.agents]
+        self._agent_index = {agent['agent_id']: i for i, agent in enumerate(self.agents)}
+        
+        # Skill/keyword incidence matrices for batched scoring
+        self._build_skill_matrices()
+        
+        # Single-pass matcher over every keyword, domain and priority term, and
+        # the domain and priority only variant used when embeddings score skills
+        self._text_matcher = self._build_text_matcher()
+        self._context_matcher = None
         
     def load_data(self):
         """Load agents and tickets data from JSON file."""
         try:
-            with open(self.dataset_file, 'r') as f:
-                data = json.load(f)
-                self.agents = data['agents']
-                self.tickets = data['tickets']
+            if orjson is not None:
+                with open(self.dataset_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.dataset_file, 'r') as f:
+                    data = json.load(f)
+            self.agents = data['agents']
+            self.tickets = data['tickets']
+            self._build_agent_arrays()
             print(f"Loaded {len(self.agents)} agents and {len(self.tickets)} tickets")
         except FileNotFoundError:
             print(f"Error: Dataset file '{self.dataset_file}' not found")
             raise
-        except json.JSONDecodeError:
+        except json.JSONDecodeError:  # Also raised by orjson
             print(f"Error: Invalid JSON in dataset file '{self.dataset_file}'")
             raise
     
@@ -116,123 +376,352 @@ class TicketAssignmentSystem:
             # Licensing
             "Software_Licensing": ["license", "software", "activation", "key"]
         }
+        
+        # Domain bits of each known skill, so scoring never rescans skill names
+        self._skill_domain = {skill: skill_domain_mask(skill) for skill in skill_keywords}
         return skill_keywords
     
+    def _skill_domain_bits(self, skill: str) -> int:
+        """Return the domain bits of a skill, classifying unknown skills on first use."""
+        bits = self._skill_domain.get(skill)
+        if bits is None:
+            bits = self._skill_domain[skill] = skill_domain_mask(skill)
+        return bits
+    
+    def _build_agent_arrays(self):
+        """Store agent attributes as per-field arrays indexed like self.agents.
+        
+        ``skill_names`` lists the distinct skills held by agents and
+        ``skill_index`` maps each to its column in ``agent_levels``.
+        """
+        self.skill_names = list(dict.fromkeys(skill for agent in self.agents for skill in agent['skills']))
+        self.skill_index = {skill: s for s, skill in enumerate(self.skill_names)}
+        
+        n_agents = len(self.agents)
+        # Levels, loads and experience keep their raw values, whatever their scale
+        self.agent_levels = np.zeros((n_agents, len(self.skill_names)))
+        self.agent_load = np.zeros(n_agents)
+        self.agent_avail = np.zeros(n_agents, dtype=bool)
+        self.agent_exp = np.zeros(n_agents)
+        skill_counts = np.zeros(n_agents)
+        
+        for a, agent in enumerate(self.agents):
+            for skill, skill_level in agent['skills'].items():
+                self.agent_levels[a, self.skill_index[skill]] = skill_level
+            self.agent_load[a] = agent['current_load']
+            self.agent_avail[a] = agent['availability_status'] == 'Available'
+            self.agent_exp[a] = agent['experience_level']
+            skill_counts[a] = len(agent['skills'])
+        
+        # Skill score normalization; agents without skills score zero anyway
+        self._agent_norms = np.sqrt(np.maximum(skill_counts, 1.0))
+    
+    def _build_skill_matrices(self):
+        """Build the matrices used to score every agent against a ticket at once.
+        
+        Skills are the distinct skills held by agents. ``_skill_keyword_matrix``
+        (skills x keyword vocabulary) and ``_skill_name_matrix`` (skills x skill
+        name words) count occurrences, so multiplying them with a ticket's
+        per-keyword scores and name hits yields each skill's raw match score.
+        ``agent_levels`` (agents x skills) then applies skill levels.
+        """
+        self._keyword_vocab = list(dict.fromkeys(
+            keyword for keywords in self.skill_keywords.values() for keyword in keywords
+        ))
+        self._keyword_index = {keyword: j for j, keyword in enumerate(self._keyword_vocab)}
+        
+        # Keywords containing each substring, for tokens that are part of a keyword
+        self._keyword_substrings = defaultdict(set)
+        for j, keyword in enumerate(self._keyword_vocab):
+            for start in range(len(keyword)):
+                for end in range(start + 1, len(keyword) + 1):
+                    self._keyword_substrings[keyword[start:end]].add(j)
+        
+        self._name_vocab = list(dict.fromkeys(
+            word for skill in self.skill_names for word in skill.lower().replace('_', ' ').split()
+        ))
+        name_index = {word: j for j, word in enumerate(self._name_vocab)}
+        
+        n_skills = len(self.skill_names)
+        self._skill_keyword_matrix = np.zeros((n_skills, len(self._keyword_vocab)))
+        self._skill_name_matrix = np.zeros((n_skills, len(self._name_vocab)))
+        self._skill_masks = np.array([self._skill_domain_bits(skill) for skill in self.skill_names], dtype=np.int64)
+        for s, skill in enumerate(self.skill_names):
+            for keyword in self.skill_keywords.get(skill, []):
+                self._skill_keyword_matrix[s, self._keyword_index[keyword]] += 1
+            for word in skill.lower().replace('_', ' ').split():
+                self._skill_name_matrix[s, name_index[word]] += 1
+    
+    def _build_text_matcher(self, include_keywords: bool = True):
+        """Build a multi-pattern matcher over skill keywords, domain and priority terms.
+        
+        Each pattern maps to ``(length, [(category, id), ...])`` where id is the
+        keyword vocabulary index, the domain bit or the PRIORITY_KEYWORDS index.
+        Uses an Aho-Corasick automaton when pyahocorasick is installed and a
+        KeywordTrie otherwise.
+        """
+        payloads = defaultdict(list)
+        if include_keywords:
+            for j, keyword in enumerate(self._keyword_vocab):
+                payloads[keyword].append((MATCH_KEYWORD, j))
+        for domain, terms in TICKET_DOMAIN_TERMS:
+            for term in terms:
+                payloads[term].append((MATCH_DOMAIN, domain))
+        for k, (keyword, _) in enumerate(PRIORITY_KEYWORDS):
+            payloads[keyword].append((MATCH_PRIORITY, k))
+        
+        matcher = ahocorasick.Automaton() if ahocorasick is not None else KeywordTrie()
+        for pattern, matches in payloads.items():
+            matcher.add_word(pattern, (len(pattern), matches))
+        if ahocorasick is not None:
+            matcher.make_automaton()
+        return matcher
+    
+    def _scan_ticket_text(self, text: str, title_end: int, matcher=None) -> Tuple[np.ndarray, int, float]:
+        """Find keyword hits, mentioned domains and the priority of a ticket.
+        
+        ``text`` is the lowercased "title description" string and ``title_end``
+        the length of its title part; ``matcher`` defaults to the full text
+        matcher. Keywords match as plain substrings;
+        domain terms must sit on word boundaries, as in has_domain_term;
+        priority keywords must lie within the title or the description.
+        """
+        phrase_hits = np.zeros(len(self._keyword_vocab))
+        domain_mask = 0
+        
+        # Matches overlapping the joining space span title and description
+        priority_hits = set()
+        
+        if matcher is None:
+            matcher = self._text_matcher
+        for end, (length, matches) in matcher.iter(text):
+            start = end - length + 1
+            for category, match_id in matches:
+                if category == MATCH_KEYWORD:
+                    phrase_hits[match_id] = 1
+                elif category == MATCH_DOMAIN:
+                    if _at_word_boundary(text, start) and _at_word_boundary(text, end + 1):
+                        domain_mask |= match_id
+                elif end < title_end or start > title_end:
+                    priority_hits.add(match_id)
+        
+        priority_score = BASE_PRIORITY + sum(PRIORITY_KEYWORDS[k][1] for k in sorted(priority_hits))
+        return phrase_hits, domain_mask, min(priority_score, MAX_PRIORITY)
+    
+    def _precompute_agent(self, agent: Dict[str, Any]) -> List[SkillProfile]:
+        """Precompute the ticket-independent parts of skill matching for an agent."""
+        profile = []
+        for skill, skill_level in agent['skills'].items():
+            profile.append((
+                skill,
+                skill_level,
+                tuple(self.skill_keywords.get(skill, [])),
+                tuple(skill.lower().replace('_', ' ').split()),
+                self._skill_domain_bits(skill),
+            ))
+        return profile
+    
+    def _agent_profile(self, agent: Dict[str, Any]) -> List[SkillProfile]:
+        """Return the precomputed skill profile of an agent."""
+        index = self._agent_index.get(agent['agent_id'])
+        if index is not None and self.agents[index] is agent:
+            return self._agent_pre[index]
+        return self._precompute_agent(agent)
+    
     def extract_keywords_from_ticket(self, ticket: Dict[str, Any]) -> List[str]:
         """Extract relevant keywords from ticket title and description."""
-        text = f"{ticket['title']} {ticket['description']}".lower()
-        
+        return self._extract_keywords(f"{ticket['title']} {ticket['description']}".lower())
+    
+    def _extract_keywords(self, text: str) -> List[str]:
+        """Extract keywords from already lowercased ticket text."""
         # Remove common stop words and clean text
-        text = re.sub(r'[^\w\s]', ' ', text)
+        text = _PUNCT_RE.sub(' ', text)
         words = text.split()
         
         # Filter out common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those', 'we', 'they', 'it', 'he', 'she', 'you', 'i', 'we', 'our', 'their', 'his', 'her', 'your', 'my'}
-        
-        keywords = [word for word in words if len(word) > 2 and word not in stop_words]
+        keywords = [word for word in words if len(word) > 2 and word not in _STOP_WORDS]
         return keywords
     
     def has_domain_term(self, text: str, terms: List[str]) -> bool:
-        """Check if text contains any of the terms using word boundaries to avoid false matches."""
+        """Check if text contains any of the terms using word boundaries to avoid false matches.
+        
+        Kept as public API; ticket scanning applies the same rule through the
+        text matcher and _at_word_boundary.
+        """
         for term in terms:
             if re.search(r'\b' + re.escape(term) + r'\b', text):
                 return True
         return False
     
+    def _ticket_features(self, ticket: Dict[str, Any]) -> TicketFeatures:
+        """Return the features of a ticket, cached for the tickets of the current run."""
+        index = self._ticket_index.get(id(ticket))
+        if index is None or self._ticket_run[index] is not ticket:
+            return self._extract_ticket_features(ticket)
+        features = self._ticket_pre[index]
+        if features is None:
+            features = self._ticket_pre[index] = self._extract_ticket_features(ticket)
+        return features
+    
+    def _precompute_ticket_features(self):
+        """Fill the ticket feature cache for all tickets of this run.
+        
+        Entries are looked up by ticket identity, so ticket dicts from outside
+        the run, or sharing a ticket_id, never see each other's features.
+        """
+        self._ticket_run = list(self.tickets)
+        self._embedding_active = self._start_embeddings()
+        self._ticket_pre = [None] * len(self.tickets)
+        self._ticket_index = {id(ticket): t for t, ticket in enumerate(self.tickets)}
+        for ticket in self.tickets:
+            self._ticket_features(ticket)
+    
+    def _extract_ticket_features(self, ticket: Dict[str, Any]) -> TicketFeatures:
+        """Compute the agent-independent features of a ticket."""
+        # Lowercase the ticket text once; every feature below reads this copy
+        title_lower = ticket['title'].lower()
+        ticket_text = f"{title_lower} {ticket['description'].lower()}"
+        
+        # Embeddings replace keyword matching, so only domains and priority are scanned
+        if self._embedding_active:
+            if self._context_matcher is None:
+                self._context_matcher = self._build_text_matcher(include_keywords=False)
+            _, domain_mask, priority = self._scan_ticket_text(ticket_text, len(title_lower), self._context_matcher)
+            return TicketFeatures(
+                text=ticket_text,
+                keyword_set=frozenset(),
+                domain_mask=domain_mask,
+                priority=priority,
+                keyword_scores=None,
+                name_hits=None,
+            )
+        
+        ticket_keywords = self._extract_keywords(ticket_text)
+        
+        # Keyword phrase hits, platform/domain detection and priority in one pass
+        phrase_hits, domain_mask, priority = self._scan_ticket_text(ticket_text, len(title_lower))
+        
+        keyword_counts = Counter(ticket_keywords)
+        keyword_set = frozenset(ticket_keywords)
+        
+        # Per-keyword score: exact phrase in text, then token-level matches
+        # weighted by how often each token occurs
+        keyword_scores = 3 * phrase_hits
+        for ticket_keyword, count in keyword_counts.items():
+            exact = self._keyword_index.get(ticket_keyword)
+            if exact is not None:  # Exact match
+                keyword_scores[exact] += 2 * count
+            
+            # Partial match: keywords within the token, or the token within keywords
+            partial = set(self._keyword_substrings.get(ticket_keyword, ()))
+            for _, (_, matches) in self._text_matcher.iter(ticket_keyword):
+                for category, match_id in matches:
+                    if category == MATCH_KEYWORD:
+                        partial.add(match_id)
+            partial.discard(exact)
+            for j in partial:
+                keyword_scores[j] += count
+        
+        name_hits = np.array([2.0 if word in keyword_set else 0.0 for word in self._name_vocab])
+        
+        return TicketFeatures(
+            text=ticket_text,
+            keyword_set=keyword_set,
+            domain_mask=domain_mask,
+            priority=priority,
+            keyword_scores=keyword_scores,
+            name_hits=name_hits,
+        )
+    
     def calculate_skill_match_score(self, ticket: Dict[str, Any], agent: Dict[str, Any]) -> Tuple[float, List[str]]:
         """Calculate how well an agent's skills match a ticket's requirements."""
-        ticket_keywords = self.extract_keywords_from_ticket(ticket)
-        ticket_text = f"{ticket['title']} {ticket['description']}".lower()
+        tf = self._ticket_features(ticket)
+        agent_pre = self._agent_profile(agent)
+        return self._skill_match(tf, agent_pre), self._matched_skills(tf, agent_pre)
+    
+    def _raw_skill_score(self, tf: TicketFeatures, skill_keywords: Tuple[str, ...], skill_name_words: Tuple[str, ...]) -> float:
+        """Keyword and skill-name score of a single skill, before level and domain weighting."""
+        # Exact phrase and token-level matching, precomputed per keyword
+        skill_score = 0
+        for keyword in skill_keywords:
+            skill_score += tf.keyword_scores[self._keyword_index[keyword]]
+        
+        # Skill name matching
+        for skill_word in skill_name_words:
+            if skill_word in tf.keyword_set:
+                skill_score += 2
+        
+        return skill_score
+    
+    def _skill_match(self, tf: TicketFeatures, agent_pre: List[SkillProfile]) -> float:
+        """Score an agent's skills against precomputed ticket features."""
+        if self._embeddings_enabled():
+            contributions = self._embedding_skill_contributions(tf, agent_pre)
+            return sum(c for _, c in contributions) / math.sqrt(len(agent_pre)) if agent_pre else 0
         
         total_score = 0
-        matched_skills = []
-        
-        # Platform/domain detection for inverse signals using word boundaries
-        is_linux_ticket = self.has_domain_term(ticket_text, ['linux', 'unix', 'chmod', 'directory permissions'])
-        is_windows_ticket = self.has_domain_term(ticket_text, ['windows', 'active directory', 'outlook', 'microsoft'])
-        is_mac_ticket = self.has_domain_term(ticket_text, ['mac', 'macos', 'macbook', 'samba'])
-        is_security_ticket = self.has_domain_term(ticket_text, ['security', 'phishing', 'attack', 'breach', 'locked', 'suspicious'])
-        is_hardware_ticket = self.has_domain_term(ticket_text, ['laptop', 'hardware', 'boot', 'printer', 'diagnostic'])
-        is_network_ticket = self.has_domain_term(ticket_text, ['network', 'vpn', 'connection', 'firewall', 'dns'])
-        is_database_ticket = self.has_domain_term(ticket_text, ['database', 'sql', 'query', 'performance', 'slow'])
-        is_cloud_ticket = self.has_domain_term(ticket_text, ['azure', 'aws', 'cloud', 'website', 'app service'])
         
         # Check each agent skill against ticket keywords
-        for skill, skill_level in agent['skills'].items():
-            skill_score = 0
-            skill_keywords = self.skill_keywords.get(skill, [])
-            
-            # Domain boost/penalty system
-            domain_multiplier = 1.0
-            
-            # Linux domain
-            if 'Linux' in skill and is_linux_ticket:
-                domain_multiplier = 2.0
-            elif 'Linux' in skill and is_windows_ticket:
-                domain_multiplier = 0.3
-            
-            # Windows domain
-            elif any(windows_term in skill for windows_term in ['Windows', 'Active_Directory', 'Microsoft']) and is_windows_ticket:
-                domain_multiplier = 2.0
-            elif any(windows_term in skill for windows_term in ['Windows', 'Active_Directory', 'Microsoft']) and is_linux_ticket:
-                domain_multiplier = 0.3
-            
-            # Mac domain
-            elif 'Mac' in skill and is_mac_ticket:
-                domain_multiplier = 2.0
-            
-            # Security domain
-            elif any(sec_term in skill for sec_term in ['Security', 'Phishing', 'Antivirus', 'Firewall']) and is_security_ticket:
-                domain_multiplier = 1.8
-            
-            # Hardware domain
-            elif any(hw_term in skill for hw_term in ['Hardware', 'Laptop', 'Printer']) and is_hardware_ticket:
-                domain_multiplier = 1.8
-            
-            # Network domain
-            elif any(net_term in skill for net_term in ['Network', 'VPN', 'DNS', 'Routing']) and is_network_ticket:
-                domain_multiplier = 1.8
-            
-            # Database domain
-            elif 'Database' in skill and is_database_ticket:
-                domain_multiplier = 2.0
-            
-            # Cloud domain
-            elif any(cloud_term in skill for cloud_term in ['Cloud', 'Azure', 'AWS', 'DevOps']) and is_cloud_ticket:
-                domain_multiplier = 1.8
-            
-            # Exact phrase matching (highest weight)
-            for keyword in skill_keywords:
-                if keyword in ticket_text:
-                    skill_score += 3  # Highest weight for exact phrase matches
-            
-            # Token-level matching
-            for keyword in skill_keywords:
-                for ticket_keyword in ticket_keywords:
-                    if keyword == ticket_keyword:  # Exact match
-                        skill_score += 2
-                    elif keyword in ticket_keyword or ticket_keyword in keyword:  # Partial match
-                        skill_score += 1
-            
-            # Skill name matching
-            skill_name_words = skill.lower().replace('_', ' ').split()
-            for skill_word in skill_name_words:
-                if skill_word in ticket_keywords:
-                    skill_score += 2
+        for skill, skill_level, skill_keywords, skill_name_words, skill_mask in agent_pre:
+            skill_score = self._raw_skill_score(tf, skill_keywords, skill_name_words)
             
             if skill_score > 0:
-                # Apply domain multiplier and skill level weighting
-                weighted_score = skill_score * skill_level * domain_multiplier
-                total_score += weighted_score
-                matched_skills.append(skill)
+                # Apply domain boost/penalty and skill level weighting
+                domain_multiplier = DOMAIN_MULTIPLIER_TABLE[skill_mask, tf.domain_mask]
+                total_score += skill_score * skill_level * domain_multiplier
         
         # Normalize score by square root of skills count to reduce bias
-        if len(agent['skills']) > 0:
-            normalized_score = total_score / math.sqrt(len(agent['skills']))
+        if len(agent_pre) > 0:
+            return total_score / math.sqrt(len(agent_pre))
+        return 0
+    
+    def _matched_skills(self, tf: TicketFeatures, agent_pre: List[SkillProfile]) -> List[str]:
+        """List the agent's skills that matched the ticket, in the agent's skill order.
+        
+        With embeddings, skills are listed by how much they contributed to
+        the score instead. Only needed for the rationale of the chosen agent,
+        so it is kept out of the scoring path.
+        """
+        if self._embeddings_enabled():
+            contributions = self._embedding_skill_contributions(tf, agent_pre)
+            return [skill for skill, c in sorted(contributions, key=lambda item: -item[1]) if c > 0]
+        
+        return [
+            skill for skill, _, skill_keywords, skill_name_words, _ in agent_pre
+            if self._raw_skill_score(tf, skill_keywords, skill_name_words) > 0
+        ]
+    
+    def _embedding_skill_contributions(self, tf: TicketFeatures, agent_pre: List[SkillProfile]) -> List[Tuple[str, float]]:
+        """Level- and domain-weighted embedding score of each of the agent's skills."""
+        raw_scores = self._embedding_raw_scores([tf])[0]
+        return [
+            (skill, raw_scores[self.skill_index[skill]] * skill_level * DOMAIN_MULTIPLIER_TABLE[skill_mask, tf.domain_mask])
+            for skill, skill_level, _, _, skill_mask in agent_pre
+            if skill in self.skill_index
+        ]
+    
+    def _keyword_raw_scores(self, features: List[TicketFeatures]) -> np.ndarray:
+        """Raw (ticket, skill) keyword and skill-name scores, before level and domain weighting."""
+        keyword_scores = np.stack([tf.keyword_scores for tf in features])
+        name_hits = np.stack([tf.name_hits for tf in features])
+        return keyword_scores @ self._skill_keyword_matrix.T + name_hits @ self._skill_name_matrix.T
+    
+    def _skill_score_matrix(self, tickets: List[Dict[str, Any]]) -> np.ndarray:
+        """Compute normalized skill match scores for every (ticket, agent) pair."""
+        features = [self._ticket_features(ticket) for ticket in tickets]
+        n_skills = len(self.skill_names)
+        if not features or n_skills == 0:
+            return np.zeros((len(tickets), len(self.agents)))
+        
+        if self._embeddings_enabled():
+            raw_scores = self._embedding_raw_scores(features)
         else:
-            normalized_score = 0
-            
-        return normalized_score, matched_skills
+            raw_scores = self._keyword_raw_scores(features)
+        
+        ticket_masks = np.array([tf.domain_mask for tf in features], dtype=np.int64)
+        
+        domain_multipliers = DOMAIN_MULTIPLIER_TABLE[self._skill_masks[None, :], ticket_masks[:, None]]
+        return (raw_scores * domain_multipliers) @ self.agent_levels.T / self._agent_norms
     
     def calculate_workload_score(self, agent: Dict[str, Any], current_assignments: int = 0) -> float:
         """Calculate workload score with fairness penalty (higher score = less loaded)."""
@@ -240,8 +729,7 @@ class TicketAssignmentSystem:
         total_load = agent['current_load'] + current_assignments
         
         # Exponential penalty for high loads to promote fairness
-        max_reasonable_load = 8
-        if total_load >= max_reasonable_load:
+        if total_load >= MAX_REASONABLE_LOAD:
             load_score = 0.1  # Very low score for overloaded agents
         else:
             # Exponential decay to heavily favor less loaded agents
@@ -252,64 +740,40 @@ class TicketAssignmentSystem:
         
         return load_score * availability_factor
     
+    def _experience_scores(self) -> np.ndarray:
+        """Vectorized calculate_experience_score for all agents."""
+        return np.minimum(self.agent_exp, MAX_EXPERIENCE) / MAX_EXPERIENCE
+    
     def calculate_experience_score(self, agent: Dict[str, Any]) -> float:
         """Calculate experience score based on agent's experience level."""
-        # Normalize experience (assuming max experience is 15)
-        max_experience = 15
-        return min(agent['experience_level'], max_experience) / max_experience
+        # Normalize experience (assuming max experience is MAX_EXPERIENCE)
+        return min(agent['experience_level'], MAX_EXPERIENCE) / MAX_EXPERIENCE
     
     def calculate_ticket_priority(self, ticket: Dict[str, Any]) -> float:
-        """Calculate ticket priority based on keywords and content."""
-        title_lower = ticket['title'].lower()
-        description_lower = ticket['description'].lower()
-        
-        # High priority keywords
-        high_priority_keywords = [
-            'critical', 'urgent', 'emergency', 'down', 'outage', 'breach', 'security',
-            'production', 'business-critical', 'attack', 'locked', 'unreachable',
-            'slow performance', 'phishing'
-        ]
+        """Calculate ticket priority based on keywords and content.
         
-        # Medium priority keywords
-        medium_priority_keywords = [
-            'unable', 'error', 'problem', 'issue', 'failed', 'not working',
-            'access denied', 'boot', 'laptop'
-        ]
-        
-        priority_score = 1.0  # Base priority
-        
-        # Check for high priority indicators
-        for keyword in high_priority_keywords:
-            if keyword in title_lower or keyword in description_lower:
-                priority_score += 2.0
-        
-        # Check for medium priority indicators
-        for keyword in medium_priority_keywords:
-            if keyword in title_lower or keyword in description_lower:
-                priority_score += 1.0
-        
-        return min(priority_score, 5.0)  # Cap at 5.0
+        Priority keywords are found in the same text scan as the skill
+        keywords, so this reads the cached ticket features.
+        """
+        return self._ticket_features(ticket).priority
     
-    def calculate_composite_score_with_fairness(self, ticket: Dict[str, Any], agent: Dict[str, Any], current_assignments: int) -> Tuple[float, Dict[str, Any]]:
-        """Calculate composite score for agent-ticket assignment with fairness considerations."""
-        skill_score, matched_skills = self.calculate_skill_match_score(ticket, agent)
+    def calculate_composite_score_with_fairness(self, ticket: Dict[str, Any], agent: Dict[str, Any], current_assignments: int,
+                                                skill_score: Optional[float] = None) -> Tuple[float, Dict[str, Any]]:
+        """Calculate composite score for agent-ticket assignment with fairness considerations.
+        
+        ``skill_score`` may be passed in when it has already been computed in
+        bulk, so only the matched skill names are derived here.
+        """
+        tf = self._ticket_features(ticket)
+        agent_pre = self._agent_profile(agent)
+        if skill_score is None:
+            skill_score = self._skill_match(tf, agent_pre)
+        matched_skills = self._matched_skills(tf, agent_pre)
         workload_score = self.calculate_workload_score(agent, current_assignments)
         experience_score = self.calculate_experience_score(agent)
-        ticket_priority = self.calculate_ticket_priority(ticket)
+        ticket_priority = tf.priority
         
-        # If skill score is very low, heavily penalize to avoid mismatches
-        skill_threshold = 5.0  # Minimum acceptable skill match
-        if skill_score < skill_threshold:
-            skill_penalty = 0.3  # Heavy penalty for poor skill matches
-        else:
-            skill_penalty = 1.0
-        
-        # Weighted combination with higher emphasis on skill matching and fairness
-        composite_score = (
-            skill_score * 0.6 +      # 60% weight on skill matching (increased)
-            workload_score * 0.3 +   # 30% weight on workload balance
-            experience_score * 0.1   # 10% weight on experience (reduced)
-        ) * ticket_priority * skill_penalty  # Apply skill penalty and priority
+        composite_score, skill_penalty = self._composite_score(skill_score, workload_score, experience_score, ticket_priority)
         
         score_details = {
             'skill_score': skill_score,
@@ -324,39 +788,234 @@ class TicketAssignmentSystem:
         
         return composite_score, score_details
     
+    def _composite_score(self, skill_score: float, workload_score: float, experience_score: float, ticket_priority: float) -> Tuple[float, float]:
+        """Combine component scores into a composite score, returning it with the skill penalty."""
+        # If skill score is very low, heavily penalize to avoid mismatches
+        if skill_score < SKILL_THRESHOLD:
+            skill_penalty = SKILL_PENALTY  # Heavy penalty for poor skill matches
+        else:
+            skill_penalty = 1.0
+        
+        # Weighted combination with higher emphasis on skill matching and fairness
+        composite_score = (
+            skill_score * SKILL_WEIGHT +            # 60% weight on skill matching (increased)
+            workload_score * WORKLOAD_WEIGHT +      # 30% weight on workload balance
+            experience_score * EXPERIENCE_WEIGHT    # 10% weight on experience (reduced)
+        ) * ticket_priority * skill_penalty  # Apply skill penalty and priority
+        
+        return composite_score, skill_penalty
+    
     def assign_tickets(self) -> List[Dict[str, Any]]:
         """Assign all tickets to optimal agents with improved fairness."""
-        assignments = []
-        agent_assignment_counts = {agent['agent_id']: 0 for agent in self.agents}
+        # Ticket features do not depend on the agent, so compute them up front
+        self._precompute_ticket_features()
         
         # Sort tickets by priority (descending)
         sorted_tickets = sorted(
             self.tickets, 
-            key=lambda t: self.calculate_ticket_priority(t), 
+            key=lambda t: self._ticket_features(t).priority, 
             reverse=True
         )
         
-        for ticket in sorted_tickets:
-            best_agent = None
-            best_score = -1
-            best_details = None
+        if linear_sum_assignment is None:
+            agent_assignment_counts = {agent['agent_id']: 0 for agent in self.agents}
+            return self._assign_greedy(sorted_tickets, agent_assignment_counts)
+        
+        return self._assign_optimal(sorted_tickets)
+    
+    def _embeddings_enabled(self) -> bool:
+        """Whether the current run scores skills by embedding similarity."""
+        return self._embedding_active
+    
+    def _start_embeddings(self) -> bool:
+        """Decide whether this run uses embeddings, loading the model if so.
+        
+        An explicit opt-in that cannot be honoured prints a warning and falls
+        back to keyword matching rather than aborting the run.
+        """
+        if not self.use_embeddings:
+            return False
+        if not _sentence_transformers_installed():
+            print("Warning: sentence-transformers is not installed; using keyword matching")
+            return False
+        if len(self.tickets) < EMBEDDING_MIN_TICKETS:
+            print(f"Warning: Embeddings need at least {EMBEDDING_MIN_TICKETS} tickets; using keyword matching")
+            return False
+        
+        try:
+            if self._embedding_model is None:
+                from sentence_transformers import SentenceTransformer  # Imported lazily: pulls in torch
+                self._embedding_model = SentenceTransformer(EMBEDDING_MODEL)
+            if self._skill_embeddings is None:
+                self._skill_embeddings = self._load_skill_embeddings()
+        except Exception as e:
+            print(f"Warning: Could not load embedding model '{EMBEDDING_MODEL}' ({e}); using keyword matching")
+            self._embedding_model = None
+            return False
+        return True
+    
+    def _embedding_raw_scores(self, features: List[TicketFeatures]) -> np.ndarray:
+        """Raw (ticket, skill) scores from cosine similarity of text embeddings.
+        
+        Similarities are mapped onto the keyword score range by the fixed
+        EMBEDDING_SCALE, so SKILL_THRESHOLD and the composite weights keep
+        their meaning. Requires a model loaded by _start_embeddings.
+        """
+        # Encode each distinct ticket text once, in a single batch
+        missing = list(dict.fromkeys(
+            tf.text for tf in features if _content_hash(tf.text) not in self._ticket_embeddings
+        ))
+        if missing:
+            encoded = self._embedding_model.encode(
+                missing, batch_size=EMBEDDING_BATCH_SIZE, convert_to_numpy=True, normalize_embeddings=True
+            )
+            for text, embedding in zip(missing, encoded):
+                self._ticket_embeddings[_content_hash(text)] = embedding
+        
+        ticket_embeddings = np.stack([self._ticket_embeddings[_content_hash(tf.text)] for tf in features])
+        similarity = ticket_embeddings @ self._skill_embeddings.T
+        return EMBEDDING_SCALE * np.maximum(similarity, 0.0)
+    
+    def _load_skill_embeddings(self) -> np.ndarray:
+        """Return normalized skill description embeddings, using the on-disk cache."""
+        descriptions = [
+            f"{skill.replace('_', ' ')}: {', '.join(self.skill_keywords.get(skill, []))}"
+            for skill in self.skill_names
+        ]
+        key = _content_hash("\n".join([EMBEDDING_MODEL] + descriptions))
+        
+        # Plain arrays only, so loading the cache can never execute code
+        try:
+            with np.load(EMBEDDING_CACHE_FILE, allow_pickle=False) as data:
+                cache = {name: data[name] for name in data.files}
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+            cache = {}
+        if key in cache:
+            return cache[key]
+        
+        embeddings = self._embedding_model.encode(
+            descriptions, batch_size=EMBEDDING_BATCH_SIZE, convert_to_numpy=True, normalize_embeddings=True
+        )
+        cache[key] = embeddings
+        try:
+            with open(EMBEDDING_CACHE_FILE, 'wb') as f:
+                np.savez(f, **cache)
+        except OSError:
+            print(f"Warning: Could not write embedding cache '{EMBEDDING_CACHE_FILE}'")
+        return embeddings
+    
+    def _agent_capacities(self) -> np.ndarray:
+        """Number of new tickets each agent can take before becoming overloaded."""
+        free_slots = np.maximum(np.ceil(MAX_REASONABLE_LOAD - self.agent_load), 0).astype(int)
+        return np.where(self.agent_avail, free_slots, 0)
+    
+    def _build_score_matrix(self, tickets: List[Dict[str, Any]], skill_scores: Optional[np.ndarray] = None) -> np.ndarray:
+        """Build the (tickets x agent slots) composite score matrix.
+        
+        Each agent is replicated into one column per ticket it can still take,
+        so column ``a * cap + k`` scores the agent's (k+1)-th new assignment.
+        Slots beyond an agent's capacity are filled with FORBIDDEN_SCORE.
+        ``skill_scores`` is computed from the tickets unless given.
+        """
+        capacities = self._agent_capacities()
+        cap = int(capacities.max(initial=0))
+        n_tickets, n_agents = len(tickets), len(self.agents)
+        
+        if skill_scores is None:
+            skill_scores = self._skill_score_matrix(tickets)
+        
+        # Slot k of an agent is its k-th extra assignment this session
+        slot_workloads = workload_scores(self.agent_load[:, None] + np.arange(cap), self.agent_avail[:, None])
+        experience_scores = self._experience_scores()
+        priorities = np.array([self._ticket_features(ticket).priority for ticket in tickets])
+        skill_penalties = np.where(skill_scores < SKILL_THRESHOLD, SKILL_PENALTY, 1.0)
+        
+        scores = (
+            skill_scores[:, :, None] * SKILL_WEIGHT +
+            slot_workloads[None, :, :] * WORKLOAD_WEIGHT +
+            experience_scores[None, :, None] * EXPERIENCE_WEIGHT
+        ) * priorities[:, None, None] * skill_penalties[:, :, None]
+        
+        valid_slots = np.arange(cap)[None, :] < capacities[:, None]
+        scores = np.where(valid_slots[None, :, :], scores, FORBIDDEN_SCORE)
+        
+        return scores.reshape(n_tickets, n_agents * cap)
+    
+    def _assign_optimal(self, sorted_tickets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Assign tickets with a globally optimal matching over agent capacity slots."""
+        assignments = []
+        agent_assignment_counts = {agent['agent_id']: 0 for agent in self.agents}
+        unassigned = list(sorted_tickets)
+        
+        skill_scores = self._skill_score_matrix(sorted_tickets)
+        scores = self._build_score_matrix(sorted_tickets, skill_scores)
+        if scores.size > 0:
+            cap = scores.shape[1] // len(self.agents)
             
-            # Evaluate each available agent
-            for agent in self.agents:
-                if agent['availability_status'] != 'Available':
+            # Solve over real slots only; a huge sentinel cost in the solver
+            # would swamp the precision of the actual scores
+            valid_cols = np.flatnonzero(scores[0] > FORBIDDEN_SCORE)
+            row_ind, col_sub = linear_sum_assignment(-scores[:, valid_cols])
+            
+            matched = {}
+            for row, col in zip(row_ind, valid_cols[col_sub]):
+                matched[row] = (col // cap, col % cap)
+            
+            unassigned = []
+            for t, ticket in enumerate(sorted_tickets):
+                if t not in matched:
+                    unassigned.append(ticket)
                     continue
                 
-                # Calculate current assignment count for fairness
-                current_assignments = agent_assignment_counts[agent['agent_id']]
-                
-                score, details = self.calculate_composite_score_with_fairness(ticket, agent, current_assignments)
+                agent_index, slot = matched[t]
+                agent = self.agents[agent_index]
+                _, details = self.calculate_composite_score_with_fairness(
+                    ticket, agent, slot, skill_score=skill_scores[t, agent_index]
+                )
                 
-                if score > best_score:
-                    best_score = score
-                    best_agent = agent
-                    best_details = details
+                assignments.append({
+                    "ticket_id": ticket['ticket_id'],
+                    "title": ticket['title'],
+                    "assigned_agent_id": agent['agent_id'],
+                    "rationale": self._generate_rationale(ticket, agent, details)
+                })
+                agent_assignment_counts[agent['agent_id']] += 1
+        
+        # Tickets beyond the total agent capacity are handed to the greedy pass
+        if unassigned:
+            assignments.extend(self._assign_greedy(unassigned, agent_assignment_counts))
+        
+        return assignments
+    
+    def _assign_greedy(self, sorted_tickets: List[Dict[str, Any]], agent_assignment_counts: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Assign tickets one at a time to the best-scoring available agent."""
+        assignments = []
+        skill_scores = self._skill_score_matrix(sorted_tickets)
+        experience_scores = self._experience_scores()
+        new_assignments = np.array([agent_assignment_counts[agent['agent_id']] for agent in self.agents])
+        agent_workloads = workload_scores(self.agent_load + new_assignments, self.agent_avail)
+        skill_penalties = np.where(skill_scores < SKILL_THRESHOLD, SKILL_PENALTY, 1.0)
+        
+        for t, ticket in enumerate(sorted_tickets):
+            ticket_priority = self._ticket_features(ticket).priority
             
-            if best_agent and best_details:
+            # Score every agent at once; unavailable agents can never win
+            row = (
+                skill_scores[t] * SKILL_WEIGHT +
+                agent_workloads * WORKLOAD_WEIGHT +
+                experience_scores * EXPERIENCE_WEIGHT
+            ) * ticket_priority * skill_penalties[t]
+            row = np.where(self.agent_avail, row, -np.inf)
+            
+            # argmax returns the first maximum, so ties go to the earliest agent
+            best_index = int(row.argmax()) if row.size > 0 else -1
+            best_agent = self.agents[best_index] if best_index >= 0 and self.agent_avail[best_index] else None
+            
+            if best_agent:
+                _, best_details = self.calculate_composite_score_with_fairness(
+                    ticket, best_agent, agent_assignment_counts[best_agent['agent_id']],
+                    skill_score=skill_scores[t, best_index]
+                )
                 
                 # Create assignment
                 assignment = {
@@ -368,8 +1027,12 @@ class TicketAssignmentSystem:
                 
                 assignments.append(assignment)
                 
-                # Update assignment count
+                # Update assignment count and the workload score it affects
                 agent_assignment_counts[best_agent['agent_id']] += 1
+                agent_workloads[best_index] = workload_scores(
+                    self.agent_load[best_index] + agent_assignment_counts[best_agent['agent_id']],
+                    self.agent_avail[best_index]
+                )
             else:
                 print(f"Warning: Could not assign ticket {ticket['ticket_id']} - no available agents")
         
@@ -409,17 +1072,28 @@ class TicketAssignmentSystem:
         
         return ", ".join(rationale_parts) + "."
     
-    def save_results(self, assignments: List[Dict[str, Any]], output_file: str = "output_result.json"):
-        """Save assignment results to JSON file."""
+    def save_results(self, assignments: List[Dict[str, Any]], output_file: str = "output_result.json", pretty: bool = False):
+        """Save assignment results to JSON file, indented only when pretty is set.
+        
+        Text is written as raw UTF-8 either way, so the bytes do not depend on
+        whether orjson is installed.
+        """
         output_data = {"assignments": assignments}
         
-        with open(output_file, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                if pretty:
+                    json.dump(output_data, f, indent=2, ensure_ascii=False)
+                else:
+                    json.dump(output_data, f, separators=(',', ':'), ensure_ascii=False)
         
         print(f"Results saved to {output_file}")
         print(f"Total assignments: {len(assignments)}")
     
-    def run(self):
+    def run(self, pretty: bool = False):
         """Run the complete ticket assignment process."""
         print("Starting Intelligent Ticket Assignment System...")
         print("=" * 50)
@@ -428,7 +1102,7 @@ class TicketAssignmentSystem:
         assignments = self.assign_tickets()
         
         # Save results
-        self.save_results(assignments)
+        self.save_results(assignments, pretty=pretty)
         
         # Display summary
         self._display_summary(assignments)
@@ -457,12 +1131,16 @@ class TicketAssignmentSystem:
         print(f"Total tickets assigned: {len(assignments)}")
         print(f"Assignment success rate: {len(assignments)/len(self.tickets)*100:.1f}%")
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main function to run the ticket assignment system."""
+    parser = argparse.ArgumentParser(description="Assign support tickets to agents.")
+    parser.add_argument('--pretty', action='store_true', help="indent the JSON written to output_result.json")
+    args = parser.parse_args(argv)
+    
     try:
         # Create and run the assignment system
         system = TicketAssignmentSystem()
-        assignments = system.run()
+        assignments = system.run(pretty=args.pretty)
         
         print("\n✅ Ticket assignment completed successfully!")
         